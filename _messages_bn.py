@@ -0,0 +1,119 @@
+"""
+Bengali bot messages, imported on first use by LanguageHandler
+"""
+
+MESSAGES = {
+    'welcome': """🤖 *বহুভাষিক AI বট এ স্বাগতম!*
+
+আমি Google Gemini দ্বারা চালিত আপনার উন্নত AI সহায়ক! আমি আপনাকে সাহায্য করতে পারি:
+
+🔧 *কোড তৈরি*
+• যেকোনো প্রোগ্রামিং ভাষা
+• অ্যাপ ডেভেলপমেন্ট
+• ওয়েবসাইট তৈরি
+• সমস্যা সমাধান
+
+💡 *প্রশ্নের উত্তর*
+• প্রযুক্তিগত প্রশ্ন
+• সাধারণ জ্ঞান
+• শিক্ষামূলক বিষয়
+• প্রোগ্রামিং সাহায্য
+
+🌐 *সমর্থিত ভাষা*
+• English
+• বাংলা
+
+*কমান্ড সমূহ:*
+/code - কোড তৈরি করুন
+/app - অ্যাপ কোড তৈরি করুন
+/web - ওয়েবসাইট কোড তৈরি করুন
+/ask - যেকোনো প্রশ্ন করুন
+/help - এই সাহায্য দেখুন
+/lang - ভাষার তথ্য
+/status - বট স্ট্যাটাস
+
+যেকোনো ভাষায় আপনার প্রশ্ন বা অনুরোধ টাইপ করুন!""",
+
+    'help': """🔧 *বট কমান্ড ও ব্যবহার*
+
+*কোড তৈরি:*
+• `/code <বর্ণনা>` - যেকোনো কোড তৈরি করুন
+• `/app <অ্যাপ আইডিয়া>` - মোবাইল/ডেস্কটপ অ্যাপ কোড
+• `/web <ওয়েবসাইট আইডিয়া>` - ওয়েবসাইট কোড তৈরি
+
+*প্রশ্নের উত্তর:*
+• `/ask <প্রশ্ন>` - যেকোনো প্রশ্ন করুন
+• সরাসরি প্রশ্ন টাইপ করুন
+
+*অন্যান্য কমান্ড:*
+• `/lang` - ভাষার তথ্য
+• `/status` - বট স্ট্যাটাস দেখুন
+• `/help` - এই সাহায্য দেখুন
+
+*উদাহরণ:*
+• `/code পাইথনে ক্যালকুলেটর বানাও`
+• `/app রিঅ্যাক্ট নেটিভে টুডু লিস্ট অ্যাপ`
+• `/web রেসপন্সিভ পোর্টফোলিও ওয়েবসাইট`
+• `/ask মেশিন লার্নিং কি?`
+
+*টিপস:*
+• আপনার অনুরোধে সুনির্দিষ্ট হন
+• বাংলা ও ইংরেজি মিশিয়ে লিখতে পারেন
+• বট প্রসঙ্গ বুঝতে পারে
+• ফ্রি টিয়ার সীমা প্রযোজ্য""",
+
+    'code_usage': '📝 ব্যবহার: `/code <আপনার কোড অনুরোধ>`\n\nউদাহরণ: `/code পাইথনে লিস্ট সর্ট করার ফাংশন বানাও`',
+
+    'app_usage': '📱 ব্যবহার: `/app <আপনার অ্যাপ আইডিয়া>`\n\nউদাহরণ: `/app রিঅ্যাক্ট নেটিভে টুডু লিস্ট অ্যাপ বানাও`',
+
+    'web_usage': '🌐 ব্যবহার: `/web <আপনার ওয়েবসাইট আইডিয়া>`\n\nউদাহরণ: `/web রেসপন্সিভ পোর্টফোলিও ওয়েবসাইট বানাও`',
+
+    'ask_usage': '❓ ব্যবহার: `/ask <আপনার প্রশ্ন>`\n\nউদাহরণ: `/ask কৃত্রিম বুদ্ধিমত্তা কি?`',
+
+    'ai_usage': '🤖 ব্যবহার: `/ai <আপনার AI/ML প্রোজেক্ট>`\n\nউদাহরণ: `/ai ইমেজ ক্লাসিফিকেশন মডেল তৈরি করুন`',
+
+    'ml_usage': '🧠 ব্যবহার: `/ml <আপনার মেশিন লার্নিং প্রোজেক্ট>`\n\nউদাহরণ: `/ml টেক্সট সেন্টিমেন্ট এনালাইসিস`',
+
+    'mobile_usage': '📱 ব্যবহার: `/mobile <আপনার মোবাইল অ্যাপ আইডিয়া>`\n\nউদাহরণ: `/mobile ফ্লাটারে ই-কমার্স অ্যাপ`',
+
+    'db_usage': '🗄️ ব্যবহার: `/db <আপনার ডাটাবেস প্রোজেক্ট>`\n\nউদাহরণ: `/db ইউজার ম্যানেজমেন্ট সিস্টেম`',
+
+    'api_usage': '🔗 ব্যবহার: `/api <আপনার API প্রোজেক্ট>`\n\nউদাহরণ: `/api RESTful API for blog`',
+
+    'language_info': """🌐 *ভাষা সাপোর্ট*
+
+*সমর্থিত ভাষা:*
+• English
+• বাংলা
+
+*বৈশিষ্ট্য:*
+• স্বয়ংক্রিয় ভাষা শনাক্তকরণ
+• মিশ্র ভাষা সাপোর্ট
+• প্রসঙ্গ-সচেতন উত্তর
+• সাংস্কৃতিক অভিযোজন
+
+*টিপস:*
+• একই বার্তায় বাংলা ও ইংরেজি মিশিয়ে লিখতে পারেন
+• বট উপযুক্ত ভাষায় উত্তর দেবে
+• প্রযুক্তিগত শব্দ দুই ভাষায় ব্যাখ্যা করা হয়""",
+
+    'status': """✅ *বট স্ট্যাটাস*
+
+🤖 *AI মডেল:* Google Gemini 2.5 Flash
+🌐 *ভাষা:* ইংরেজি, বাংলা
+🔧 *বৈশিষ্ট্য:* কোড তৈরি, প্রশ্নোত্তর, অ্যাপ ডেভেলপমেন্ট
+⚡ *স্ট্যাটাস:* অনলাইন এবং প্রস্তুত
+🆓 *টিয়ার:* ফ্রি (রেট লিমিটেড)
+🔒 *নিরাপত্তা:* এন্ড-টু-এন্ড প্রসেসিং
+👨‍💻 *তৈরি করেছেন:* Rafsan Maruf
+
+*সক্ষমতা:*
+• বহুভাষিক কোড তৈরি
+• উন্নত প্রশ্নোত্তর
+• অ্যাপ এবং ওয়েবসাইট ডেভেলপমেন্ত
+• প্রযুক্তিগত সমস্যা সমাধান""",
+
+    'rate_limit': '⏰ আপনি খুব তাড়াতাড়ি অনুরোধ পাঠাচ্ছেন। একটু অপেক্ষা করে আবার চেষ্টা করুন।',
+
+    'error': '❌ দুঃখিত, আপনার অনুরোধ প্রক্রিয়া করতে ত্রুটি হয়েছে। পরে আবার চেষ্টা করুন।',
+}
@@ -0,0 +1,119 @@
+"""
+English bot messages, imported on first use by LanguageHandler
+"""
+
+MESSAGES = {
+    'welcome': """🤖 *Welcome to Multilingual AI Bot!*
+
+I'm your advanced AI assistant powered by Google Gemini! I can help you with:
+
+🔧 *Code Generation*
+• Any programming language
+• App development
+• Website creation
+• Problem solving
+
+💡 *Question Answering*
+• Technical questions
+• General knowledge
+• Educational content
+• Programming help
+
+🌐 *Languages Supported*
+• English
+• বাংলা (Bengali)
+
+*Commands:*
+/code - Generate code
+/app - Create app code
+/web - Create website code
+/ask - Ask any question
+/help - Show this help
+/lang - Language info
+/status - Bot status
+
+Just type your question or request in any language!""",
+
+    'help': """🔧 *Bot Commands & Usage*
+
+*Code Generation:*
+• `/code <description>` - Generate any code
+• `/app <app idea>` - Create mobile/desktop app code
+• `/web <website idea>` - Create website code
+
+*Question Answering:*
+• `/ask <question>` - Ask any question
+• Just type your question directly
+
+*Other Commands:*
+• `/lang` - Language information
+• `/status` - Check bot status
+• `/help` - Show this help
+
+*Examples:*
+• `/code create a calculator in python`
+• `/app todo list app in react native`
+• `/web responsive portfolio website`
+• `/ask what is machine learning?`
+
+*Tips:*
+• Be specific in your requests
+• You can mix Bengali and English
+• The bot understands context
+• Free tier limits apply""",
+
+    'code_usage': '📝 Usage: `/code <your code request>`\n\nExample: `/code create a python function to sort a list`',
+
+    'app_usage': '📱 Usage: `/app <your app idea>`\n\nExample: `/app create a todo list app in React Native`',
+
+    'web_usage': '🌐 Usage: `/web <your website idea>`\n\nExample: `/web create a responsive portfolio website`',
+
+    'ask_usage': '❓ Usage: `/ask <your question>`\n\nExample: `/ask what is artificial intelligence?`',
+
+    'ai_usage': '🤖 Usage: `/ai <your AI/ML project>`\n\nExample: `/ai create an image classification model`',
+
+    'ml_usage': '🧠 Usage: `/ml <your machine learning project>`\n\nExample: `/ml text sentiment analysis`',
+
+    'mobile_usage': '📱 Usage: `/mobile <your mobile app idea>`\n\nExample: `/mobile e-commerce app in Flutter`',
+
+    'db_usage': '🗄️ Usage: `/db <your database project>`\n\nExample: `/db user management system`',
+
+    'api_usage': '🔗 Usage: `/api <your API project>`\n\nExample: `/api RESTful API for blog`',
+
+    'language_info': """🌐 *Language Support*
+
+*Supported Languages:*
+• English
+• বাংলা (Bengali)
+
+*Features:*
+• Automatic language detection
+• Mixed language support
+• Context-aware responses
+• Cultural adaptation
+
+*Tips:*
+• You can mix Bengali and English in the same message
+• The bot will respond in the appropriate language
+• Technical terms are explained in both languages""",
+
+    'status': """✅ *Bot Status*
+
+🤖 *AI Model:* Google Gemini 2.5 Flash
+🌐 *Languages:* English, Bengali
+🔧 *Features:* Code Generation, Q&A, App Development
+⚡ *Status:* Online and Ready
+🆓 *Tier:* Free (Rate Limited)
+🔒 *Security:* End-to-end processing
+👨‍💻 *Created by:* Rafsan Maruf
+
+*Capabilities:*
+• Multi-language code generation
+• Advanced question answering
+• App and website development
+• Technical problem solving""",
+
+    'rate_limit': "⏰ You're sending requests too quickly. Please wait a moment and try again.",
+
+    'error': '❌ Sorry, there was an error processing your request. Please try again later.',
+}
@@ -4,445 +4,403 @@ Main Telegram Bot implementation with Gemini integration
 
 import asyncio
 import logging
+import re
+from collections import OrderedDict
 from typing import Optional
+
+# uvloop speeds up the socket-heavy asyncio work this bot lives on;
+# fall back silently to the stdlib loop where it isn't installed
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from telegram import Update, BotCommand
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
 from telegram.constants import ParseMode, ChatAction
+from telegram.error import BadRequest
 
-from config import Config
+from config import get_config
 from gemini_client import GeminiClient
 from language_handler import LanguageHandler
 from commands import Commands
 from rate_limiter import RateLimiter
-from utils import format_code_response, escape_markdown
+from utils import iter_formatted_chunks, escape_markdown, is_markdown_safe, log_user_interaction
 
 logger = logging.getLogger(__name__)
 
+# Questions about the bot's creator, matched in one pass over the lowercased
+# message instead of a substring scan per keyword
+_CREATOR_KEYWORDS = [
+    'কে তৈরি', 'কে বানিয়েছে', 'কে ডেভেলপ', 'কে বানায়', 'তৈরি করেছে', 'তৈরি করছে',
+    'who created', 'who developed', 'who made', 'who built', 'created by', 'developed by'
+]
+_CREATOR_PATTERN = re.compile('|'.join(map(re.escape, _CREATOR_KEYWORDS)))
+
+# Bot command menu, built once at import
+_BOT_COMMANDS = (
+    BotCommand("start", "Start the bot / বট শুরু করুন"),
+    BotCommand("help", "Show help / সাহায্য দেখুন"),
+    BotCommand("code", "Generate code / কোড তৈরি করুন"),
+    BotCommand("app", "Create app code / অ্যাপ কোড তৈরি করুন"),
+    BotCommand("web", "Create website code / ওয়েবসাইট কোড তৈরি করুন"),
+    BotCommand("ai", "AI/ML projects / AI/ML প্রোজেক্ট"),
+    BotCommand("mobile", "Mobile app dev / মোবাইল অ্যাপ"),
+    BotCommand("api", "API development / API ডেভেলপমেন্ট"),
+    BotCommand("ask", "Ask any question / যেকোনো প্রশ্ন করুন"),
+    BotCommand("lang", "Change language / ভাষা পরিবর্তন করুন"),
+    BotCommand("status", "Bot status / বট স্ট্যাটাস"),
+)
+
+# Code-generation commands: (command, request type, usage message key)
+_COMMAND_SPECS = [
+    ("code", "code", "code_usage"),
+    ("app", "app", "app_usage"),
+    ("web", "web", "web_usage"),
+    ("ai", "ai", "ai_usage"),
+    ("ml", "ml", "ml_usage"),
+    ("mobile", "mobile", "mobile_usage"),
+    ("db", "database", "db_usage"),
+    ("api", "api", "api_usage"),
+]
+
+# Telegram enforces roughly 30 messages per second bot-wide
+_SEND_INTERVAL = 1.0 / 30.0
+
+# Cap on retained per-chat locks; the least recently active chat's lock
+# is dropped once it is idle, so the table stays bounded like the rate
+# limiter's shards
+_MAX_CHAT_LOCKS = 1024
+
 class TelegramBot:
     """Main Telegram bot class"""
-    
+
+    __slots__ = (
+        "config", "gemini_client", "language_handler", "rate_limiter",
+        "commands", "application", "_chat_locks", "_background_tasks",
+        "_gemini_semaphore", "_send_lock", "_next_send_time",
+    )
+
     def __init__(self):
-        self.config = Config()
-        self.gemini_client = GeminiClient()
+        self.config = get_config()
+        self.gemini_client = GeminiClient(self.config.gemini_api_key)
         self.language_handler = LanguageHandler()
         self.rate_limiter = RateLimiter()
         self.commands = Commands(self.gemini_client, self.language_handler)
-        
+
+        # Per-chat locks keep replies ordered within a chat while slow Gemini
+        # calls from unrelated chats run concurrently; kept in LRU order so
+        # idle chats can be evicted (see _dispatch_background)
+        self._chat_locks = OrderedDict()
+        self._background_tasks = set()
+        self._gemini_semaphore = asyncio.Semaphore(8)
+
+        # Global pacing state for outgoing messages (see _pace_send)
+        self._send_lock = asyncio.Lock()
+        self._next_send_time = 0.0
+
         # Initialize the application
-        self.application = Application.builder().token(self.config.telegram_token).build()
+        self.application = (
+            Application.builder()
+            .token(self.config.telegram_token)
+            .concurrent_updates(True)
+            .pool_timeout(30)
+            .connection_pool_size(64)
+            .build()
+        )
         self._setup_handlers()
-    
+
     def _setup_handlers(self):
         """Setup all command and message handlers"""
         # Command handlers
         self.application.add_handler(CommandHandler("start", self.start_command))
         self.application.add_handler(CommandHandler("help", self.help_command))
-        self.application.add_handler(CommandHandler("code", self.code_command))
-        self.application.add_handler(CommandHandler("app", self.app_command))
-        self.application.add_handler(CommandHandler("web", self.web_command))
+
+        # Code-generation commands share one parameterized handler
+        for command, request_type, usage_key in _COMMAND_SPECS:
+            self.application.add_handler(
+                CommandHandler(command, self._make_code_handler(request_type, usage_key))
+            )
+
         self.application.add_handler(CommandHandler("ask", self.ask_command))
         self.application.add_handler(CommandHandler("lang", self.language_command))
         self.application.add_handler(CommandHandler("status", self.status_command))
-        self.application.add_handler(CommandHandler("ai", self.ai_command))
-        self.application.add_handler(CommandHandler("ml", self.ml_command))
-        self.application.add_handler(CommandHandler("mobile", self.mobile_command))
-        self.application.add_handler(CommandHandler("db", self.database_command))
-        self.application.add_handler(CommandHandler("api", self.api_command))
-        
+
         # Message handler for general queries
         self.application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message))
-        
+
         # Error handler
         self.application.add_error_handler(self.error_handler)
-        
+
         # Set commands on startup - will be called automatically when polling starts
-    
+
+    def _make_code_handler(self, request_type: str, usage_key: str):
+        """Build the handler coroutine for one code-generation command"""
+        async def handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
+            # effective_user is a property walk; read it once
+            user = update.effective_user
+            user_id = user.id
+            user_lang = self.language_handler.detect_user_language(user.language_code)
+
+            if not self.rate_limiter.check_rate_limit(user_id):
+                rate_limit_msg = self.language_handler.get_message("rate_limit", user_lang)
+                await update.message.reply_text(rate_limit_msg)
+                return
+
+            # The command's argument text is already in message.text; one
+            # partition beats rebuilding it from the args list
+            request_text = update.message.text.partition(' ')[2].strip()
+
+            if not request_text:
+                usage_msg = self.language_handler.get_message(usage_key, user_lang)
+                await update.message.reply_text(usage_msg)
+                return
+
+            self._dispatch_background(
+                update.effective_chat.id,
+                self._dispatch(update, request_text, True, request_type)
+            )
+
+        return handler
+
+    def _dispatch_background(self, chat_id: int, coro):
+        """Run long Gemini work off the handler without blocking other chats"""
+        locks = self._chat_locks
+        lock = locks.get(chat_id)
+        if lock is None:
+            # Bound the table: drop the stalest lock that is not mid-dispatch
+            if len(locks) >= _MAX_CHAT_LOCKS:
+                for stale_id, stale_lock in locks.items():
+                    if not stale_lock.locked():
+                        del locks[stale_id]
+                        break
+            lock = asyncio.Lock()
+            locks[chat_id] = lock
+        else:
+            locks.move_to_end(chat_id)
+
+        async def _run():
+            async with lock:
+                await coro
+
+        task = asyncio.create_task(_run())
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     def start(self):
         """Start the bot"""
         try:
             logger.info("Bot started successfully")
-            
-            # Start polling with post_init hook for setting commands
+
+            # Start with post_init hook for setting commands
             async def post_init(app):
+                # Warm the async Gemini pool in the background; the serving
+                # path uses client.aio, so that is the pool that matters
+                warmup_task = asyncio.create_task(self.gemini_client.warmup())
+                self._background_tasks.add(warmup_task)
+                warmup_task.add_done_callback(self._background_tasks.discard)
+
                 await self._set_bot_commands()
-            
+
             self.application.post_init = post_init
-            self.application.run_polling(drop_pending_updates=True)
-            
+
+            if self.config.webhook_url:
+                # Webhook avoids the long-poll round trip per update batch
+                self.application.run_webhook(
+                    listen="0.0.0.0",
+                    port=self.config.webhook_port,
+                    webhook_url=self.config.webhook_url,
+                    drop_pending_updates=True
+                )
+            else:
+                self.application.run_polling(drop_pending_updates=True)
+
         except Exception as e:
-            logger.error(f"Error starting bot: {e}")
+            logger.error("Error starting bot: %s", e)
             raise
-    
+
     async def _set_bot_commands(self):
         """Set bot commands for better UX"""
-        commands = [
-            BotCommand("start", "Start the bot / বট শুরু করুন"),
-            BotCommand("help", "Show help / সাহায্য দেখুন"),
-            BotCommand("code", "Generate code / কোড তৈরি করুন"),
-            BotCommand("app", "Create app code / অ্যাপ কোড তৈরি করুন"),
-            BotCommand("web", "Create website code / ওয়েবসাইট কোড তৈরি করুন"),
-            BotCommand("ai", "AI/ML projects / AI/ML প্রোজেক্ট"),
-            BotCommand("mobile", "Mobile app dev / মোবাইল অ্যাপ"),
-            BotCommand("api", "API development / API ডেভেলপমেন্ট"),
-            BotCommand("ask", "Ask any question / যেকোনো প্রশ্ন করুন"),
-            BotCommand("lang", "Change language / ভাষা পরিবর্তন করুন"),
-            BotCommand("status", "Bot status / বট স্ট্যাটাস"),
-        ]
-        
-        await self.application.bot.set_my_commands(commands)
-    
+        await self.application.bot.set_my_commands(_BOT_COMMANDS)
+
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
-        user_id = update.effective_user.id
-        user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-        
+        user = update.effective_user
+        user_id = user.id
+        user_lang = self.language_handler.detect_user_language(user.language_code)
+
         welcome_message = self.language_handler.get_message("welcome", user_lang)
-        
+
         await update.message.reply_text(
             welcome_message,
             parse_mode=ParseMode.MARKDOWN
         )
-    
+
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command"""
         user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
         help_message = self.language_handler.get_message("help", user_lang)
-        
+
         await update.message.reply_text(
             help_message,
             parse_mode=ParseMode.MARKDOWN
         )
-    
-    async def code_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /code command for code generation"""
-        user_id = update.effective_user.id
-        
-        # Check rate limit
-        if not self.rate_limiter.check_rate_limit(user_id):
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            rate_limit_msg = self.language_handler.get_message("rate_limit", user_lang)
-            await update.message.reply_text(rate_limit_msg)
-            return
-        
-        # Get the code request
-        request_text = " ".join(context.args) if context.args else ""
-        
-        if not request_text:
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            usage_msg = self.language_handler.get_message("code_usage", user_lang)
-            await update.message.reply_text(usage_msg)
-            return
-        
-        await self._process_code_request(update, request_text, "code")
-    
-    async def app_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /app command for app development"""
-        user_id = update.effective_user.id
-        
-        if not self.rate_limiter.check_rate_limit(user_id):
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            rate_limit_msg = self.language_handler.get_message("rate_limit", user_lang)
-            await update.message.reply_text(rate_limit_msg)
-            return
-        
-        request_text = " ".join(context.args) if context.args else ""
-        
-        if not request_text:
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            usage_msg = self.language_handler.get_message("app_usage", user_lang)
-            await update.message.reply_text(usage_msg)
-            return
-        
-        await self._process_code_request(update, request_text, "app")
-    
-    async def web_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /web command for website development"""
-        user_id = update.effective_user.id
-        
-        if not self.rate_limiter.check_rate_limit(user_id):
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            rate_limit_msg = self.language_handler.get_message("rate_limit", user_lang)
-            await update.message.reply_text(rate_limit_msg)
-            return
-        
-        request_text = " ".join(context.args) if context.args else ""
-        
-        if not request_text:
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            usage_msg = self.language_handler.get_message("web_usage", user_lang)
-            await update.message.reply_text(usage_msg)
-            return
-        
-        await self._process_code_request(update, request_text, "web")
-    
+
     async def ask_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /ask command for general questions"""
-        user_id = update.effective_user.id
-        
+        user = update.effective_user
+        user_id = user.id
+        user_lang = self.language_handler.detect_user_language(user.language_code)
+
         if not self.rate_limiter.check_rate_limit(user_id):
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
             rate_limit_msg = self.language_handler.get_message("rate_limit", user_lang)
             await update.message.reply_text(rate_limit_msg)
             return
-        
-        question = " ".join(context.args) if context.args else ""
-        
+
+        question = update.message.text.partition(' ')[2].strip()
+
         if not question:
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
             usage_msg = self.language_handler.get_message("ask_usage", user_lang)
             await update.message.reply_text(usage_msg)
             return
-        
-        await self._process_general_question(update, question)
-    
+
+        self._dispatch_background(
+            update.effective_chat.id,
+            self._dispatch(update, question, False)
+        )
+
     async def language_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /lang command for language switching"""
         user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
         lang_message = self.language_handler.get_message("language_info", user_lang)
-        
+
         await update.message.reply_text(lang_message)
-    
+
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /status command"""
         user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
         status_message = self.language_handler.get_message("status", user_lang)
-        
+
         await update.message.reply_text(status_message)
-    
-    async def ai_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /ai command for AI/ML projects"""
-        user_id = update.effective_user.id
-        
-        if not self.rate_limiter.check_rate_limit(user_id):
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            rate_limit_msg = self.language_handler.get_message("rate_limit", user_lang)
-            await update.message.reply_text(rate_limit_msg)
-            return
-        
-        request_text = " ".join(context.args) if context.args else ""
-        
-        if not request_text:
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            if user_lang == 'bn':
-                usage_msg = "🤖 ব্যবহার: `/ai <আপনার AI/ML প্রোজেক্ট>`\n\nউদাহরণ: `/ai ইমেজ ক্লাসিফিকেশন মডেল তৈরি করুন`"
-            else:
-                usage_msg = "🤖 Usage: `/ai <your AI/ML project>`\n\nExample: `/ai create an image classification model`"
-            await update.message.reply_text(usage_msg)
-            return
-        
-        await self._process_code_request(update, request_text, "ai")
-    
-    async def ml_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /ml command for machine learning"""
-        user_id = update.effective_user.id
-        
-        if not self.rate_limiter.check_rate_limit(user_id):
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            rate_limit_msg = self.language_handler.get_message("rate_limit", user_lang)
-            await update.message.reply_text(rate_limit_msg)
-            return
-        
-        request_text = " ".join(context.args) if context.args else ""
-        
-        if not request_text:
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            if user_lang == 'bn':
-                usage_msg = "🧠 ব্যবহার: `/ml <আপনার মেশিন লার্নিং প্রোজেক্ট>`\n\nউদাহরণ: `/ml টেক্সট সেন্টিমেন্ট এনালাইসিস`"
-            else:
-                usage_msg = "🧠 Usage: `/ml <your machine learning project>`\n\nExample: `/ml text sentiment analysis`"
-            await update.message.reply_text(usage_msg)
-            return
-        
-        await self._process_code_request(update, request_text, "ml")
-    
-    async def mobile_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /mobile command for mobile app development"""
-        user_id = update.effective_user.id
-        
-        if not self.rate_limiter.check_rate_limit(user_id):
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            rate_limit_msg = self.language_handler.get_message("rate_limit", user_lang)
-            await update.message.reply_text(rate_limit_msg)
-            return
-        
-        request_text = " ".join(context.args) if context.args else ""
-        
-        if not request_text:
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            if user_lang == 'bn':
-                usage_msg = "📱 ব্যবহার: `/mobile <আপনার মোবাইল অ্যাপ আইডিয়া>`\n\nউদাহরণ: `/mobile ফ্লাটারে ই-কমার্স অ্যাপ`"
-            else:
-                usage_msg = "📱 Usage: `/mobile <your mobile app idea>`\n\nExample: `/mobile e-commerce app in Flutter`"
-            await update.message.reply_text(usage_msg)
-            return
-        
-        await self._process_code_request(update, request_text, "mobile")
-    
-    async def database_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /db command for database development"""
-        user_id = update.effective_user.id
-        
-        if not self.rate_limiter.check_rate_limit(user_id):
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            rate_limit_msg = self.language_handler.get_message("rate_limit", user_lang)
-            await update.message.reply_text(rate_limit_msg)
-            return
-        
-        request_text = " ".join(context.args) if context.args else ""
-        
-        if not request_text:
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            if user_lang == 'bn':
-                usage_msg = "🗄️ ব্যবহার: `/db <আপনার ডাটাবেস প্রোজেক্ট>`\n\nউদাহরণ: `/db ইউজার ম্যানেজমেন্ট সিস্টেম`"
-            else:
-                usage_msg = "🗄️ Usage: `/db <your database project>`\n\nExample: `/db user management system`"
-            await update.message.reply_text(usage_msg)
-            return
-        
-        await self._process_code_request(update, request_text, "database")
-    
-    async def api_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /api command for API development"""
-        user_id = update.effective_user.id
-        
-        if not self.rate_limiter.check_rate_limit(user_id):
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            rate_limit_msg = self.language_handler.get_message("rate_limit", user_lang)
-            await update.message.reply_text(rate_limit_msg)
-            return
-        
-        request_text = " ".join(context.args) if context.args else ""
-        
-        if not request_text:
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            if user_lang == 'bn':
-                usage_msg = "🔗 ব্যবহার: `/api <আপনার API প্রোজেক্ট>`\n\nউদাহরণ: `/api RESTful API for blog`"
-            else:
-                usage_msg = "🔗 Usage: `/api <your API project>`\n\nExample: `/api RESTful API for blog`"
-            await update.message.reply_text(usage_msg)
-            return
-        
-        await self._process_code_request(update, request_text, "api")
-    
+
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle general text messages"""
-        user_id = update.effective_user.id
+        user = update.effective_user
+        user_id = user.id
         message_text = update.message.text
-        
+
         # Check for creator questions first
-        creator_keywords = [
-            'কে তৈরি', 'কে বানিয়েছে', 'কে ডেভেলপ', 'কে বানায়', 'তৈরি করেছে', 'তৈরি করছে',
-            'who created', 'who developed', 'who made', 'who built', 'created by', 'developed by'
-        ]
-        
         message_lower = message_text.lower()
-        is_creator_question = any(keyword in message_lower for keyword in creator_keywords)
-        
+        is_creator_question = _CREATOR_PATTERN.search(message_lower) is not None
+
         if is_creator_question:
             language = self.language_handler.detect_message_language(message_text)
             if language == "bn":
                 creator_response = "আমাকে Rafsan Maruf তৈরি করেছেন।"
             else:
                 creator_response = "I was created by Rafsan Maruf."
-            
+
             await update.message.reply_text(creator_response)
             return
-        
+
         # Check rate limit
         if not self.rate_limiter.check_rate_limit(user_id):
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
+            user_lang = self.language_handler.detect_user_language(user.language_code)
             rate_limit_msg = self.language_handler.get_message("rate_limit", user_lang)
             await update.message.reply_text(rate_limit_msg)
             return
-        
-        # Enhanced detection logic
-        is_code_request = self.language_handler.is_code_request(message_text)
-        
+
+        # Enhanced detection logic, reusing the lowercased copy from above
+        is_code_request = self.language_handler.is_code_request(message_text, message_lower)
+
         # Log for debugging
-        logger.info(f"Message: {message_text[:50]}... | Is code request: {is_code_request}")
-        
-        # Try both approaches - if one fails, try the other
+        logger.info("Message: %.50s... | Is code request: %s", message_text, is_code_request)
+
+        # One Gemini round trip; _dispatch reports a localized error on failure
+        # instead of retrying with the opposite classification
+        self._dispatch_background(
+            update.effective_chat.id,
+            self._dispatch(update, message_text, is_code_request)
+        )
+
+    async def _dispatch(self, update: Update, text: str, is_code: bool, request_type: str = "general"):
+        """Run one Gemini round trip and send the (possibly chunked) reply"""
         try:
-            if is_code_request:
-                await self._process_code_request(update, message_text, "general")
-            else:
-                await self._process_general_question(update, message_text)
-        except Exception as e:
-            logger.error(f"Error in primary processing: {e}")
-            # Fallback to alternative processing
-            try:
-                if not is_code_request:
-                    await self._process_code_request(update, message_text, "general")
-                else:
-                    await self._process_general_question(update, message_text)
-            except Exception as e2:
-                logger.error(f"Error in fallback processing: {e2}")
-                # Final fallback - direct response
-                user_lang = self.language_handler.detect_message_language(message_text)
-                if user_lang == 'bn':
-                    await update.message.reply_text("দুঃখিত, একটি ত্রুটি হয়েছে। আবার চেষ্টা করুন।")
+            # Let the typing indicator travel while language detection runs
+            typing_task = asyncio.create_task(update.message.chat.send_action(ChatAction.TYPING))
+            user_lang = self.language_handler.detect_message_language(text)
+            await typing_task
+
+            async with self._gemini_semaphore:
+                if is_code:
+                    response = await self.commands.generate_code(text, request_type, user_lang)
                 else:
-                    await update.message.reply_text("Sorry, there was an error. Please try again.")
-    
-    async def _process_code_request(self, update: Update, request: str, request_type: str):
-        """Process code generation requests"""
-        await update.message.chat.send_action(ChatAction.TYPING)
-        
-        try:
-            user_lang = self.language_handler.detect_message_language(request)
-            response = await self.commands.generate_code(request, request_type, user_lang)
-            
-            # Format and send the response
-            formatted_response = format_code_response(response)
-            
-            # Split long messages if needed
-            if len(formatted_response) > 4096:
-                chunks = [formatted_response[i:i+4096] for i in range(0, len(formatted_response), 4096)]
-                for chunk in chunks:
-                    try:
-                        await update.message.reply_text(chunk, parse_mode=ParseMode.MARKDOWN)
-                    except Exception as e:
-                        # If markdown fails, send as plain text
-                        await update.message.reply_text(chunk)
-            else:
-                try:
-                    await update.message.reply_text(formatted_response, parse_mode=ParseMode.MARKDOWN)
-                except Exception as e:
-                    # If markdown fails, send as plain text
-                    await update.message.reply_text(formatted_response)
-                
-        except Exception as e:
-            logger.error(f"Error processing code request: {e}")
-            user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
-            error_msg = self.language_handler.get_message("error", user_lang)
-            await update.message.reply_text(error_msg)
-    
-    async def _process_general_question(self, update: Update, question: str):
-        """Process general questions"""
-        await update.message.chat.send_action(ChatAction.TYPING)
-        
-        try:
-            user_lang = self.language_handler.detect_message_language(question)
-            response = await self.commands.answer_question(question, user_lang)
-            
-            # Split long messages if needed and send without markdown to avoid parsing issues
-            if len(response) > 4096:
-                chunks = [response[i:i+4096] for i in range(0, len(response), 4096)]
-                for chunk in chunks:
-                    await update.message.reply_text(chunk)
+                    response = await self.commands.answer_question(text, user_lang)
+
+            if is_code:
+                # Format and chunk in one pass; send as markdown
+                chunks = iter_formatted_chunks(response)
+                parse_mode = ParseMode.MARKDOWN
             else:
-                await update.message.reply_text(response)
-                
+                # Plain-text answers only need the size split
+                chunks = (response[start:start+4096] for start in range(0, len(response), 4096))
+                parse_mode = None
+
+            # The first chunk goes out immediately; the rest are sent in
+            # parallel over the pooled connections instead of serial round trips
+            first = next(chunks, None)
+            if first is not None:
+                await self._reply_chunk(update, first, parse_mode)
+                rest = [self._reply_chunk(update, chunk, parse_mode) for chunk in chunks]
+                if rest:
+                    await asyncio.gather(*rest)
+
+            # Non-critical bookkeeping after the reply is out; the queued
+            # log handler makes this a fire-and-forget enqueue
+            user = update.effective_user
+            log_user_interaction(
+                user.id, user.username,
+                request_type if is_code else "question",
+                len(text),
+            )
+
         except Exception as e:
-            logger.error(f"Error processing question: {e}")
+            logger.error("Error processing request: %s", e)
             user_lang = self.language_handler.detect_user_language(update.effective_user.language_code)
             error_msg = self.language_handler.get_message("error", user_lang)
             await update.message.reply_text(error_msg)
-    
+
+    async def _pace_send(self):
+        """Space outgoing messages so chunk bursts stay under Telegram's
+        bot-wide ~30 msg/s ceiling instead of tripping flood control"""
+        loop = asyncio.get_running_loop()
+        async with self._send_lock:
+            now = loop.time()
+            if self._next_send_time > now:
+                await asyncio.sleep(self._next_send_time - now)
+                now = self._next_send_time
+            self._next_send_time = now + _SEND_INTERVAL
+
+    async def _reply_chunk(self, update: Update, chunk: str, parse_mode: Optional[str]):
+        """Send one reply chunk, downgrading to plain text when markdown would not parse"""
+        await self._pace_send()
+        # is_markdown_safe catches the common parse failures up front, but
+        # it is a heuristic; when Telegram still rejects the entities,
+        # resend as plain text rather than losing the reply
+        if parse_mode and is_markdown_safe(chunk):
+            try:
+                await update.message.reply_text(chunk, parse_mode=parse_mode)
+                return
+            except BadRequest:
+                pass
+        await update.message.reply_text(chunk)
+
     async def error_handler(self, update: object, context: ContextTypes.DEFAULT_TYPE):
         """Handle errors"""
-        logger.error(f"Exception while handling an update: {context.error}")
-        
+        logger.error("Exception while handling an update: %s", context.error)
+
         if isinstance(update, Update) and update.effective_message:
             try:
                 user_lang = self.language_handler.detect_user_language(
@@ -451,4 +409,4 @@ class TelegramBot:
                 error_msg = self.language_handler.get_message("error", user_lang)
                 await update.effective_message.reply_text(error_msg)
             except Exception as e:
-                logger.error(f"Error sending error message: {e}")
+                logger.error("Error sending error message: %s", e)
@@ -2,65 +2,91 @@
 Configuration settings for the Telegram bot
 """
 
+import functools
 import os
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _envint(env, key: str, default: str) -> int:
+    """Read an integer setting from an environment snapshot"""
+    return int(env.get(key, default))
+
 class Config:
     """Configuration class for bot settings"""
-    
+
+    # Settings are read-only after construction; slots keep attribute
+    # reads off the instance dict and catch accidental writes to typos
+    __slots__ = (
+        "telegram_token",
+        "gemini_api_key",
+        "rate_limit_per_user",
+        "rate_limit_window",
+        "max_message_length",
+        "timeout",
+        "webhook_url",
+        "webhook_port",
+        "log_level",
+        "log_file",
+        "debug_mode",
+    )
+
     def __init__(self):
+        # Read every setting from one environment mapping instead of a
+        # separate os.getenv call per key
+        env = os.environ
+
         # Telegram Bot Token
-        self.telegram_token = os.getenv("TELEGRAM_BOT_TOKEN")
+        self.telegram_token = env.get("TELEGRAM_BOT_TOKEN")
         if not self.telegram_token:
             raise ValueError("TELEGRAM_BOT_TOKEN environment variable is required")
-        
+
         # Gemini API Key
-        self.gemini_api_key = os.getenv("GEMINI_API_KEY")
+        self.gemini_api_key = env.get("GEMINI_API_KEY")
         if not self.gemini_api_key:
             raise ValueError("GEMINI_API_KEY environment variable is required")
-        
+
         # Rate limiting settings
-        self.rate_limit_per_user = int(os.getenv("RATE_LIMIT_PER_USER", "10"))  # requests per minute
-        self.rate_limit_window = int(os.getenv("RATE_LIMIT_WINDOW", "60"))  # seconds
-        
+        self.rate_limit_per_user = _envint(env, "RATE_LIMIT_PER_USER", "10")  # requests per minute
+        self.rate_limit_window = _envint(env, "RATE_LIMIT_WINDOW", "60")  # seconds
+
         # Bot settings
-        self.max_message_length = int(os.getenv("MAX_MESSAGE_LENGTH", "4096"))
-        self.timeout = int(os.getenv("REQUEST_TIMEOUT", "30"))  # seconds
-        
+        self.max_message_length = _envint(env, "MAX_MESSAGE_LENGTH", "4096")
+        self.timeout = _envint(env, "REQUEST_TIMEOUT", "30")  # seconds
+
+        # Webhook settings - if WEBHOOK_URL is unset the bot falls back to polling
+        self.webhook_url = env.get("WEBHOOK_URL")
+        self.webhook_port = _envint(env, "WEBHOOK_PORT", "8443")
+
         # Logging settings
-        self.log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-        self.log_file = os.getenv("LOG_FILE", "bot.log")
-        
+        self.log_level = env.get("LOG_LEVEL", "INFO").upper()
+        self.log_file = env.get("LOG_FILE", "bot.log")
+
         # Debug mode
-        self.debug_mode = os.getenv("DEBUG_MODE", "False").lower() == "true"
-        
-        logger.info("Configuration loaded successfully")
-        
-        if self.debug_mode:
-            logger.info(f"Rate limit: {self.rate_limit_per_user} requests per {self.rate_limit_window} seconds")
-            logger.info(f"Max message length: {self.max_message_length}")
-            logger.info(f"Request timeout: {self.timeout} seconds")
-    
-    def validate(self):
-        """Validate configuration settings"""
-        if not self.telegram_token:
-            raise ValueError("Telegram bot token is required")
-        
-        if not self.gemini_api_key:
-            raise ValueError("Gemini API key is required")
-        
+        self.debug_mode = env.get("DEBUG_MODE", "False").lower() == "true"
+
+        # Fail fast on nonsensical values instead of deferring to a
+        # separate validate() pass callers may forget to run
         if self.rate_limit_per_user <= 0:
             raise ValueError("Rate limit per user must be positive")
-        
+
         if self.rate_limit_window <= 0:
             raise ValueError("Rate limit window must be positive")
-        
+
         if self.max_message_length <= 0:
             raise ValueError("Max message length must be positive")
-        
+
         if self.timeout <= 0:
             raise ValueError("Request timeout must be positive")
+
+        logger.info("Configuration loaded successfully")
         
-        logger.info("Configuration validation passed")
+        if self.debug_mode:
+            logger.info("Rate limit: %d requests per %d seconds", self.rate_limit_per_user, self.rate_limit_window)
+            logger.info("Max message length: %d", self.max_message_length)
+            logger.info("Request timeout: %d seconds", self.timeout)
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config instance, built on first use"""
+    return Config()
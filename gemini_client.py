@@ -5,105 +5,19 @@ Google Gemini API client for the Telegram bot
 import logging
 import os
 from typing import Optional
-from google import genai
-from google.genai import types
 
 logger = logging.getLogger(__name__)
 
-class GeminiClient:
-    """Client for interacting with Google Gemini API"""
-    
-    def __init__(self):
-        self.api_key = os.getenv("GEMINI_API_KEY")
-        if not self.api_key:
-            raise ValueError("GEMINI_API_KEY environment variable is required")
-        
-        self.client = genai.Client(api_key=self.api_key)
-        self.model_name = "gemini-2.5-flash"  # Using the newest model series
-        
-        logger.info("Gemini client initialized successfully")
-    
-    async def generate_code(self, prompt: str, language: str = "en") -> str:
-        """Generate code based on the given prompt"""
-        try:
-            # Enhance the prompt for better code generation
-            system_instruction = self._get_code_system_instruction(language)
-            enhanced_prompt = f"{system_instruction}\n\nUser Request: {prompt}"
-            
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=enhanced_prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.3,  # Lower temperature for more deterministic code
-                    max_output_tokens=8192,
-                )
-            )
-            
-            if response and response.text:
-                return response.text.strip()
-            elif response and response.candidates:
-                # Try to get text from candidates
-                for candidate in response.candidates:
-                    if candidate.content and candidate.content.parts:
-                        for part in candidate.content.parts:
-                            if hasattr(part, 'text') and part.text:
-                                return part.text.strip()
-            
-            # Fallback message
-            if language == "bn":
-                return "দুঃখিত, আমি কোড তৈরি করতে পারিনি। আবার চেষ্টা করুন।"
-            else:
-                return "Sorry, I couldn't generate code. Please try again."
-                
-        except Exception as e:
-            logger.error(f"Error generating code: {e}")
-            if language == "bn":
-                return f"কোড তৈরিতে ত্রুটি হয়েছে। আবার চেষ্টা করুন।"
-            else:
-                return f"Error generating code. Please try again."
-    
-    async def answer_question(self, question: str, language: str = "en") -> str:
-        """Answer general questions"""
-        try:
-            system_instruction = self._get_qa_system_instruction(language)
-            enhanced_prompt = f"{system_instruction}\n\nQuestion: {question}"
-            
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=enhanced_prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.7,  # Higher temperature for more creative answers
-                    max_output_tokens=4096,
-                )
-            )
-            
-            if response and response.text:
-                return response.text.strip()
-            elif response and response.candidates:
-                # Try to get text from candidates
-                for candidate in response.candidates:
-                    if candidate.content and candidate.content.parts:
-                        for part in candidate.content.parts:
-                            if hasattr(part, 'text') and part.text:
-                                return part.text.strip()
-            
-            # Fallback message
-            if language == "bn":
-                return "দুঃখিত, আমি এই প্রশ্নের উত্তর দিতে পারিনি। আবার চেষ্টা করুন।"
-            else:
-                return "Sorry, I couldn't answer your question. Please try again."
-                
-        except Exception as e:
-            logger.error(f"Error answering question: {e}")
-            if language == "bn":
-                return f"প্রশ্নের উত্তর দিতে ত্রুটি হয়েছে। আবার চেষ্টা করুন।"
-            else:
-                return f"Error answering question. Please try again."
-    
-    def _get_code_system_instruction(self, language: str) -> str:
-        """Get system instruction for code generation"""
-        if language == "bn":
-            return """আপনি একজন বিশেষজ্ঞ প্রোগ্রামার এবং সফটওয়্যার ডেভেলপার। আপনার ক্ষমতা:
+# Connection pool shared by all Gemini calls for the process lifetime.
+# Keep-alive avoids paying the TCP+TLS handshake per request, and the
+# raised per-host limit lets concurrent users hit the API in parallel.
+_POOL_MAX_CONNECTIONS = 50
+
+
+# System instructions are constant per language; build them (and the prompt
+# prefixes they expand into) once at import
+_CODE_SYS = {
+    "bn": """আপনি একজন বিশেষজ্ঞ প্রোগ্রামার এবং সফটওয়্যার ডেভেলপার। আপনার ক্ষমতা:
 
 💻 **প্রোগ্রামিং ভাষা সমূহ:**
 - Python, JavaScript, Java, C++, HTML/CSS, PHP, Go, Rust
@@ -127,9 +41,8 @@ class GeminiClient:
 - টেস্টিং ও ডিবাগিং
 - ডকুমেন্টেশন ও কমেন্ট
 
-আপনি বাংলা-ইংরেজি মিক্স ভাষায় উত্তর দেবেন এবং কোডের সাথে ব্যাখ্যা দেবেন।"""
-        else:
-            return """You are an expert programmer and full-stack software developer with advanced capabilities:
+আপনি বাংলা-ইংরেজি মিক্স ভাষায় উত্তর দেবেন এবং কোডের সাথে ব্যাখ্যা দেবেন।""",
+    "en": """You are an expert programmer and full-stack software developer with advanced capabilities:
 
 💻 **Programming Languages & Frameworks:**
 - Python, JavaScript, Java, C++, HTML/CSS, PHP, Go, Rust
@@ -155,12 +68,11 @@ class GeminiClient:
 - Clean architecture & SOLID principles
 - Detailed documentation & comments
 
-Provide complete, working solutions with clear explanations and best practices."""
-    
-    def _get_qa_system_instruction(self, language: str) -> str:
-        """Get system instruction for question answering"""
-        if language == "bn":
-            return """আপনি একটি অত্যন্ত বুদ্ধিমান এবং সহায়ক AI সহকারী। আপনি যেকোনো ধরনের প্রশ্নের বিস্তারিত, সঠিক এবং উপকারী উত্তর দিতে পারেন।
+Provide complete, working solutions with clear explanations and best practices.""",
+}
+
+_QA_SYS = {
+    "bn": """আপনি একটি অত্যন্ত বুদ্ধিমান এবং সহায়ক AI সহকারী। আপনি যেকোনো ধরনের প্রশ্নের বিস্তারিত, সঠিক এবং উপকারী উত্তর দিতে পারেন।
 
 গুরুত্বপূর্ণ তথ্য:
 - আপনি Rafsan Maruf দ্বারা তৈরি একটি বট
@@ -173,9 +85,8 @@ Provide complete, working solutions with clear explanations and best practices."
 - উদাহরণ এবং ব্যাখ্যা সহ বিস্তারিত তথ্য দিন
 - যদি কোনো তথ্য নিশ্চিত না হন সেটা বলুন কিন্তু সম্ভাব্য উত্তর দিন
 - সব ধরনের প্রশ্ন প্রযুক্তিগত সাধারণ জ্ঞান শিক্ষামূলক সবকিছুর উত্তর দিতে পারেন
-- সর্বদা সহায়ক বন্ধুত্বপূর্ণ এবং তথ্যবহুল হোন"""
-        else:
-            return """You are an extremely intelligent and helpful AI assistant. You can answer any type of question with detailed, accurate, and useful information.
+- সর্বদা সহায়ক বন্ধুত্বপূর্ণ এবং তথ্যবহুল হোন""",
+    "en": """You are an extremely intelligent and helpful AI assistant. You can answer any type of question with detailed, accurate, and useful information.
 
 Important information:
 - You are a bot created by Rafsan Maruf
@@ -188,4 +99,147 @@ Instructions:
 - Give detailed information with examples and explanations
 - If you're not certain about some information mention it but still provide the best possible answer
 - You can answer all types of questions technical general knowledge educational everything
-- Always be helpful friendly and informative"""
+- Always be helpful friendly and informative""",
+}
+
+_CODE_PROMPT_PREFIX = {lang: text + "\n\nUser Request: " for lang, text in _CODE_SYS.items()}
+_QA_PROMPT_PREFIX = {lang: text + "\n\nQuestion: " for lang, text in _QA_SYS.items()}
+
+_CODE_FALLBACK = {
+    "bn": "দুঃখিত, আমি কোড তৈরি করতে পারিনি। আবার চেষ্টা করুন।",
+    "en": "Sorry, I couldn't generate code. Please try again.",
+}
+
+_QA_FALLBACK = {
+    "bn": "দুঃখিত, আমি এই প্রশ্নের উত্তর দিতে পারিনি। আবার চেষ্টা করুন।",
+    "en": "Sorry, I couldn't answer your question. Please try again.",
+}
+
+
+def _extract_text(response) -> Optional[str]:
+    """Pull the generated text out of a Gemini response, if any"""
+    if response is None:
+        return None
+    if response.text:
+        return response.text.strip()
+    # Fall back to walking the candidate parts
+    if response.candidates:
+        for candidate in response.candidates:
+            if candidate.content and candidate.content.parts:
+                for part in candidate.content.parts:
+                    if hasattr(part, 'text') and part.text:
+                        return part.text.strip()
+    return None
+
+
+class GeminiClient:
+    """Client for interacting with Google Gemini API"""
+    
+    def __init__(self, api_key: Optional[str] = None):
+        # Importing the SDK pulls in a large dependency tree, so defer it
+        # until a client is actually built instead of paying the cost when
+        # bot.py is first imported
+        global genai, types
+        import httpx
+        from google import genai
+        from google.genai import types
+
+        # The key normally arrives from Config so the environment is only
+        # scanned once per process; os.getenv is kept as a fallback
+        self.api_key = api_key or os.getenv("GEMINI_API_KEY")
+        if not self.api_key:
+            raise ValueError("GEMINI_API_KEY environment variable is required")
+
+        pool_limits = httpx.Limits(
+            max_connections=_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=_POOL_MAX_CONNECTIONS,
+        )
+
+        # One client (and one underlying HTTP session) reused for every call
+        self.client = genai.Client(
+            api_key=self.api_key,
+            http_options=types.HttpOptions(
+                client_args={"limits": pool_limits},
+                async_client_args={"limits": pool_limits},
+            ),
+        )
+        self.model_name = "gemini-2.5-flash"  # Using the newest model series
+
+        logger.info("Gemini client initialized successfully")
+
+    async def warmup(self):
+        """Open the async client's HTTPS connection ahead of the first request
+
+        Generation goes through client.aio, whose httpx pool is separate
+        from the sync client's, so the warmup must use the same aio path.
+        """
+        try:
+            await self.client.aio.models.list()
+            logger.info("Gemini connection pool warmed up")
+        except Exception as e:
+            logger.debug("Gemini warmup skipped: %s", e)
+    
+    async def generate_code(self, prompt: str, language: str = "en") -> str:
+        """Generate code based on the given prompt"""
+        try:
+            # Enhance the prompt for better code generation
+            prefix = _CODE_PROMPT_PREFIX.get(language, _CODE_PROMPT_PREFIX["en"])
+            enhanced_prompt = prefix + prompt
+
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=enhanced_prompt,
+                config=types.GenerateContentConfig(
+                    temperature=0.3,  # Lower temperature for more deterministic code
+                    max_output_tokens=8192,
+                )
+            )
+            
+            text = _extract_text(response)
+            if text:
+                return text
+
+            return _CODE_FALLBACK.get(language, _CODE_FALLBACK["en"])
+                
+        except Exception as e:
+            logger.error("Error generating code: %s", e)
+            if language == "bn":
+                return f"কোড তৈরিতে ত্রুটি হয়েছে। আবার চেষ্টা করুন।"
+            else:
+                return f"Error generating code. Please try again."
+    
+    async def answer_question(self, question: str, language: str = "en") -> str:
+        """Answer general questions"""
+        try:
+            prefix = _QA_PROMPT_PREFIX.get(language, _QA_PROMPT_PREFIX["en"])
+            enhanced_prompt = prefix + question
+
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=enhanced_prompt,
+                config=types.GenerateContentConfig(
+                    temperature=0.7,  # Higher temperature for more creative answers
+                    max_output_tokens=4096,
+                )
+            )
+            
+            text = _extract_text(response)
+            if text:
+                return text
+
+            return _QA_FALLBACK.get(language, _QA_FALLBACK["en"])
+                
+        except Exception as e:
+            logger.error("Error answering question: %s", e)
+            if language == "bn":
+                return f"প্রশ্নের উত্তর দিতে ত্রুটি হয়েছে। আবার চেষ্টা করুন।"
+            else:
+                return f"Error answering question. Please try again."
+    
+    def _get_code_system_instruction(self, language: str) -> str:
+        """Get system instruction for code generation"""
+        return _CODE_SYS.get(language, _CODE_SYS["en"])
+    
+    def _get_qa_system_instruction(self, language: str) -> str:
+        """Get system instruction for question answering"""
+        return _QA_SYS.get(language, _QA_SYS["en"])
@@ -4,35 +4,58 @@ Multilingual Telegram Bot with Google Gemini Integration
 Main entry point for the bot application
 """
 
-import asyncio
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from bot import TelegramBot
 
-# Configure logging
+# Skip thread/process id collection on every log record; nothing in the
+# format string uses them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Hand records to a queue and let a listener thread do the formatting and
+# file/stream writes, so logging never blocks the event loop on disk I/O
+_log_queue = queue.SimpleQueue()
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('bot.log')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    _file_handler,
+    _stream_handler,
+    respect_handler_level=True,
+)
+
+# The queue handler only carries the raw message; the listener's handlers
+# apply the real format when they emit
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
 logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     level=logging.INFO,
-    handlers=[
-        logging.FileHandler('bot.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[_queue_handler]
 )
 
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 def check_environment():
     """Check if required environment variables are set"""
-    required_vars = ['TELEGRAM_BOT_TOKEN', 'GEMINI_API_KEY']
-    missing_vars = []
-    
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
-    
+    # One snapshot read instead of an os.getenv call per variable
+    env = os.environ
+    missing_vars = [var for var in ('TELEGRAM_BOT_TOKEN', 'GEMINI_API_KEY') if not env.get(var)]
+
     if missing_vars:
-        logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
+        logger.error("Missing required environment variables: %s", ', '.join(missing_vars))
         logger.error("Please set the following environment variables:")
         logger.error("export TELEGRAM_BOT_TOKEN='your_telegram_bot_token'")
         logger.error("export GEMINI_API_KEY='your_gemini_api_key'")
@@ -53,7 +76,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -62,5 +85,5 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Application terminated by user")
     except Exception as e:
-        logger.error(f"Application error: {e}")
+        logger.error("Application error: %s", e)
         sys.exit(1)
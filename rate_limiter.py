@@ -0,0 +1,167 @@
+"""
+Rate limiting functionality to manage API usage within free tier limits
+"""
+
+import time
+import logging
+from collections import OrderedDict
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+# Bound once so the hot path loads it as a global, not an attribute chain
+_monotonic = time.monotonic
+
+# Buckets are sharded by user id so concurrent checks and cleanup sweeps
+# touch independent dicts instead of contending on one big mapping
+_NUM_SHARDS = 16
+_SHARD_MASK = _NUM_SHARDS - 1
+
+# Hard cap per shard (~128k users total); the least recently seen user is
+# evicted when a shard fills, so memory stays bounded without a full scan
+_MAX_USERS_PER_SHARD = 8192
+
+class RateLimiter:
+    """Token-bucket rate limiter to prevent API abuse and stay within free tier limits"""
+
+    def __init__(self, max_requests: int = 10, window_seconds: int = 60):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+
+        # Tokens refill continuously so the window slides instead of resetting
+        self.refill_rate = max_requests / window_seconds  # tokens per second
+
+        # Each shard maps user_id -> [tokens, last_refill] in LRU order;
+        # checks are O(1) and eviction pops the stalest entry
+        self._shards: List["OrderedDict[int, List[float]]"] = [
+            OrderedDict() for _ in range(_NUM_SHARDS)
+        ]
+        self._next_cleanup_shard = 0
+        self._call_count = 0
+
+        logger.info("Rate limiter initialized: %d requests per %d seconds", max_requests, window_seconds)
+
+    def _get_bucket(self, user_id: int):
+        return self._shards[user_id & _SHARD_MASK].get(user_id)
+
+    def check_rate_limit(self, user_id: int) -> bool:
+        """
+        Check if user is within rate limit
+
+        Args:
+            user_id: Telegram user ID
+
+        Returns:
+            True if request is allowed, False if rate limited
+        """
+        # Amortize stale-entry eviction over the hot path: one shard is
+        # swept every 4096 checks, so no call ever scans the whole table
+        self._call_count += 1
+        if not self._call_count & 0xFFF:
+            self.cleanup_next_shard()
+
+        # Locals are cheaper than repeated self.* attribute loads here
+        now = _monotonic()
+        max_requests = self.max_requests
+        shard = self._shards[user_id & _SHARD_MASK]
+        bucket = shard.get(user_id)
+
+        if bucket is None:
+            if len(shard) >= _MAX_USERS_PER_SHARD:
+                shard.popitem(last=False)
+            shard[user_id] = [max_requests - 1.0, now]
+            return True
+
+        shard.move_to_end(user_id)
+        tokens, last_refill = bucket
+        tokens = min(float(max_requests), tokens + (now - last_refill) * self.refill_rate)
+
+        if tokens < 1.0:
+            bucket[0] = tokens
+            bucket[1] = now
+            logger.warning("Rate limit exceeded for user %s", user_id)
+            return False
+
+        bucket[0] = tokens - 1.0
+        bucket[1] = now
+        return True
+
+    def get_remaining_requests(self, user_id: int) -> int:
+        """
+        Get remaining requests for a user in the current window
+
+        Args:
+            user_id: Telegram user ID
+
+        Returns:
+            Number of remaining requests
+        """
+        bucket = self._get_bucket(user_id)
+        if bucket is None:
+            return self.max_requests
+
+        now = _monotonic()
+        tokens = min(float(self.max_requests), bucket[0] + (now - bucket[1]) * self.refill_rate)
+
+        return max(0, int(tokens))
+
+    def get_reset_time(self, user_id: int) -> float:
+        """
+        Get time until rate limit resets for a user
+
+        Args:
+            user_id: Telegram user ID
+
+        Returns:
+            Seconds until reset, 0 if not rate limited
+        """
+        bucket = self._get_bucket(user_id)
+        if bucket is None:
+            return 0.0
+
+        now = _monotonic()
+        tokens = min(float(self.max_requests), bucket[0] + (now - bucket[1]) * self.refill_rate)
+
+        if tokens >= 1.0:
+            return 0.0
+
+        return (1.0 - tokens) / self.refill_rate
+
+    def cleanup_shard(self, shard_index: int) -> int:
+        """
+        Clean up idle users in one shard
+
+        Args:
+            shard_index: Index of the shard to sweep
+
+        Returns:
+            Number of users removed
+        """
+        now = _monotonic()
+        shard = self._shards[shard_index & _SHARD_MASK]
+        users_to_remove = []
+
+        for user_id, bucket in shard.items():
+            tokens = bucket[0] + (now - bucket[1]) * self.refill_rate
+
+            # A full bucket means the user has been idle for at least a window
+            if tokens >= self.max_requests:
+                users_to_remove.append(user_id)
+
+        for user_id in users_to_remove:
+            del shard[user_id]
+
+        return len(users_to_remove)
+
+    def cleanup_next_shard(self) -> int:
+        """Sweep the next shard round-robin, so no single pass stalls all users"""
+        removed = self.cleanup_shard(self._next_cleanup_shard)
+        self._next_cleanup_shard = (self._next_cleanup_shard + 1) & _SHARD_MASK
+        return removed
+
+    def cleanup_old_data(self):
+        """Clean up old request data to prevent memory leaks"""
+        removed = sum(self.cleanup_shard(i) for i in range(_NUM_SHARDS))
+
+        if removed:
+            logger.info("Cleaned up rate limit data for %d inactive users", removed)
@@ -8,6 +8,35 @@ from typing import List
 
 logger = logging.getLogger(__name__)
 
+# All patterns are compiled once at import so the hot formatting helpers
+# never probe (or lose) re's internal pattern cache
+
+# Common code patterns for _is_code_line
+_CODE_LINE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'^(def|class|function|var|let|const|import|from|#include)',  # Function/class/import declarations
+        r'^[a-zA-Z_][a-zA-Z0-9_]*\s*=',  # Variable assignments
+        r'^\s*(if|for|while|try|catch|switch|case)',  # Control structures
+        r'^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*\(',  # Function calls
+        r'[{};]$',  # Code line endings
+        r'^\s*[<>]\w+',  # HTML tags
+        r'^\s*\.|^\s*#|^\s*//',  # CSS, comments
+        r'console\.|print\(|echo\s',  # Output statements
+    )
+]
+
+# Characters that need escaping in Telegram MarkdownV2
+# One C-level pass with a codepoint table beats a regex substitution for
+# the MarkdownV2 escape set
+_MD_ESCAPE_TABLE = str.maketrans({c: '\\' + c for c in '_*[]()~`>#+-=|{}.!\\'})
+
+# Code fence spacing fixes for clean_code_response
+_FENCE_LANG = re.compile(r'```(\w+)')
+_FENCE_TRAILING_BLANK = re.compile(r'```\n\n')
+
+# Complete ``` blocks, stripped before checking emphasis balance
+_FENCED_BLOCK = re.compile(r'```.*?```', re.DOTALL)
+
 def format_code_response(response: str) -> str:
     """
     Format code response with proper markdown formatting
@@ -57,32 +86,91 @@ def format_code_response(response: str) -> str:
         return '\n'.join(formatted_lines)
         
     except Exception as e:
-        logger.error(f"Error formatting code response: {e}")
+        logger.error("Error formatting code response: %s", e)
         return response
 
+def _iter_formatted_lines(response: str):
+    """Yield formatted response lines, fencing detected code blocks as we go"""
+    # If the response already contains code blocks, pass it through untouched
+    if "```" in response:
+        yield from response.split('\n')
+        return
+
+    in_code_block = False
+
+    for line in response.split('\n'):
+        if _is_code_line(line) and not in_code_block:
+            # Start a code block
+            yield f"```{_detect_language(line)}"
+            yield line
+            in_code_block = True
+        elif in_code_block and (line.strip() == "" or _is_code_line(line)):
+            # Continue code block
+            yield line
+        elif in_code_block:
+            # End code block
+            yield "```"
+            yield ""
+            yield line
+            in_code_block = False
+        else:
+            # Regular text
+            yield line
+
+    # Close any open code block
+    if in_code_block:
+        yield "```"
+
+def iter_formatted_chunks(response: str, size: int = 4096):
+    """
+    Format a response and yield ready-to-send chunks in a single pass
+
+    Fuses format_code_response with chunk splitting so neither the full
+    formatted string nor a list of chunks is ever materialized.
+
+    Args:
+        response: Raw response from Gemini
+        size: Maximum characters per chunk
+
+    Yields:
+        Formatted chunks no longer than size characters
+    """
+    buf = []
+    buf_len = 0
+
+    for line in _iter_formatted_lines(response):
+        # Hard-split lines that alone exceed the chunk size
+        while len(line) > size:
+            if buf:
+                yield '\n'.join(buf)
+                buf = []
+                buf_len = 0
+            yield line[:size]
+            line = line[size:]
+
+        joined_len = buf_len + len(line) + (1 if buf else 0)
+        if joined_len > size:
+            yield '\n'.join(buf)
+            buf = [line]
+            buf_len = len(line)
+        else:
+            buf.append(line)
+            buf_len = joined_len
+
+    if buf:
+        yield '\n'.join(buf)
+
 def _is_code_line(line: str) -> bool:
     """Check if a line looks like code"""
     line = line.strip()
     
     if not line:
         return False
-    
-    # Common code patterns
-    code_patterns = [
-        r'^(def|class|function|var|let|const|import|from|#include)',  # Function/class/import declarations
-        r'^[a-zA-Z_][a-zA-Z0-9_]*\s*=',  # Variable assignments
-        r'^\s*(if|for|while|try|catch|switch|case)',  # Control structures
-        r'^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*\(',  # Function calls
-        r'[{};]$',  # Code line endings
-        r'^\s*[<>]\w+',  # HTML tags
-        r'^\s*\.|^\s*#|^\s*//',  # CSS, comments
-        r'console\.|print\(|echo\s',  # Output statements
-    ]
-    
-    for pattern in code_patterns:
-        if re.search(pattern, line, re.IGNORECASE):
+
+    for pattern in _CODE_LINE_PATTERNS:
+        if pattern.search(line):
             return True
-    
+
     return False
 
 def _detect_language(line: str) -> str:
@@ -119,17 +207,30 @@ def escape_markdown(text: str) -> str:
     Returns:
         Escaped text safe for markdown
     """
-    # Characters that need escaping in Telegram MarkdownV2
-    escape_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!', '\\']
-    
-    # First escape backslashes
-    text = text.replace('\\', '\\\\')
-    
-    # Then escape other characters
-    for char in escape_chars[:-1]:  # Skip backslash as it's already done
-        text = text.replace(char, f'\\{char}')
-    
-    return text
+    # One pass over the text instead of one str.replace per character
+    return text.translate(_MD_ESCAPE_TABLE)
+
+def is_markdown_safe(text: str) -> bool:
+    """
+    Check whether text will pass Telegram's markdown parser
+
+    Args:
+        text: Message text about to be sent
+
+    Returns:
+        True if the markdown entities look balanced
+    """
+    # An odd number of fences can never parse
+    if text.count('```') % 2 != 0:
+        return False
+
+    # Emphasis markers must pair up outside complete code blocks
+    outside = _FENCED_BLOCK.sub('', text)
+    for marker in ('`', '*', '_'):
+        if outside.count(marker) % 2 != 0:
+            return False
+
+    return True
 
 def split_long_message(message: str, max_length: int = 4096) -> List[str]:
     """
@@ -144,29 +245,33 @@ def split_long_message(message: str, max_length: int = 4096) -> List[str]:
     """
     if len(message) <= max_length:
         return [message]
-    
+
+    # Walk the message by index instead of splitting it into line objects;
+    # each chunk is one slice with no intermediate list or rejoining
     chunks = []
-    lines = message.split('\n')
-    current_chunk = ""
-    
-    for line in lines:
-        # If adding this line would exceed the limit
-        if len(current_chunk) + len(line) + 1 > max_length:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-                current_chunk = line + '\n'
-            else:
-                # Line is too long, split it further
-                while len(line) > max_length:
-                    chunks.append(line[:max_length])
-                    line = line[max_length:]
-                current_chunk = line + '\n' if line else ""
-        else:
-            current_chunk += line + '\n'
-    
-    if current_chunk.strip():
-        chunks.append(current_chunk.strip())
-    
+    n = len(message)
+    start = 0
+
+    while n - start > max_length:
+        end = start + max_length
+
+        # Break on the last newline in range, unless that would leave the
+        # chunk less than half full
+        br = message.rfind('\n', start, end)
+        if br <= start + max_length // 2:
+            br = end
+
+        chunk = message[start:br].strip()
+        if chunk:
+            chunks.append(chunk)
+
+        # Skip the newline the chunk broke on
+        start = br + 1 if message[br:br + 1] == '\n' else br
+
+    tail = message[start:].strip()
+    if tail:
+        chunks.append(tail)
+
     return chunks
 
 def clean_code_response(response: str) -> str:
@@ -187,8 +292,8 @@ def clean_code_response(response: str) -> str:
     response = response.replace('\n\n```', '\n```')
     
     # Ensure proper spacing around code blocks
-    response = re.sub(r'```(\w+)', r'\n```\1', response)
-    response = re.sub(r'```\n\n', r'```\n', response)
+    response = _FENCE_LANG.sub(r'\n```\1', response)
+    response = _FENCE_TRAILING_BLANK.sub('```\n', response)
     
     return response
 
@@ -202,5 +307,5 @@ def log_user_interaction(user_id: int, username: str, message_type: str, message
         message_type: Type of message (code, question, etc.)
         message_length: Length of the message
     """
-    logger.info(f"User interaction - ID: {user_id}, Username: {username}, "
-                f"Type: {message_type}, Length: {message_length}")
+    logger.info("User interaction - ID: %s, Username: %s, Type: %s, Length: %d",
+                user_id, username, message_type, message_length)